@@ -19,150 +19,323 @@ Exit codes:
 """
 
 import ast
+import fnmatch
+import functools
+import os
 import re
 import sys
 from pathlib import Path
 
+# hashlib/pickle (opt-in disk cache) and concurrent.futures (large batches
+# only) are imported lazily at their call sites so the common small
+# pre-commit invocation pays interpreter + stdlib startup only.
 
-class DocstringValidator:
-    """Validator for Google-style docstrings.
+# On-disk record cache, keyed by (path, mtime_ns, size). Opt-in via
+# DOCSTRING_VALIDATOR_CACHE=1 so repeated pre-commit runs over unchanged
+# files become a stat + pickle load instead of a full ast.parse.
+_CACHE_DIR = Path(".cache/docstring_validator")
 
-    This class parses Python files and validates that all public functions,
-    methods, and classes have proper Google-style docstrings with required
-    sections.
+# Files larger than this are memory-mapped instead of read into a buffer
+_MMAP_THRESHOLD = 64 * 1024
 
-    Attributes:
-        errors (List[str]): List of validation error messages.
-        warnings (List[str]): List of validation warning messages.
+# Pre-compiled docstring-section patterns; _validate_docstring_format runs
+# once per function per file, so compiling here keeps pattern parsing off
+# the hot path.
+_RE_ARGS_HDR = re.compile(r"^\s*Args:\s*$", re.MULTILINE)
+_RE_RETURNS_HDR = re.compile(r"^\s*Returns:\s*$", re.MULTILINE)
+_RE_ATTRIBUTES_HDR = re.compile(r"^\s*Attributes:\s*$", re.MULTILINE)
+_RE_ARG_ENTRY = re.compile(r"^\s*(\w+)\s*\(.*?\):", re.MULTILINE)
+
+# A docstring record: (lineno, kind, full_name, docstring, args, has_return)
+# where kind is "class" or "function". Records are plain tuples so they
+# pickle cheaply for the on-disk cache.
+DocstringRecord = tuple[int, str, str, str | None, tuple[str, ...], bool]
+
+# A reported issue: (filepath, lineno, name, message). Kept structured until
+# print_results so full-repo runs don't pay f-string allocation per finding
+# and JSON output can be emitted without re-running.
+Issue = tuple[str, int, str, str]
+
+
+def _cache_enabled() -> bool:
+    """Check whether the on-disk record cache is enabled.
+
+    Returns:
+        bool: True if DOCSTRING_VALIDATOR_CACHE=1 is set in the environment.
 
     """
+    return os.environ.get("DOCSTRING_VALIDATOR_CACHE") == "1"
 
-    def __init__(self):
-        """Initialize the docstring validator."""
-        self.errors: list[str] = []
-        self.warnings: list[str] = []
 
-    def validate_file(self, filepath: Path) -> bool:
-        """Validate all docstrings in a Python file.
+def _collect_return_flags(tree: ast.AST) -> dict[ast.AST, bool]:
+    """Collect valued-return flags for every function in a single pass.
 
-        Args:
-            filepath (Path): Path to the Python file to validate.
+    Walks the tree once, maintaining a stack of enclosing functions; each
+    ``return`` with a value marks every function on the stack. This replaces
+    a per-function ``ast.walk`` that re-visited nested subtrees O(depth)
+    times.
 
-        Returns:
-            bool: True if all validations pass, False otherwise.
+    Args:
+        tree (ast.AST): Parsed module tree.
 
-        """
-        try:
-            with open(filepath, encoding="utf-8") as f:
-                content = f.read()
+    Returns:
+        dict[ast.AST, bool]: Mapping of function node to whether it (or a
+            function nested within it) contains a return statement with a
+            value.
 
-            # Parse the Python file
-            tree = ast.parse(content, filename=str(filepath))
+    """
+    flags: dict[ast.AST, bool] = {}
+    stack: list[ast.AST] = []
+
+    def visit(node: ast.AST):
+        is_function = isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        if is_function:
+            flags[node] = False
+            stack.append(node)
+        elif isinstance(node, ast.Return) and node.value is not None:
+            for func in stack:
+                flags[func] = True
 
-            # Visit all nodes
-            self._visit_node(tree, filepath)
+        for child in ast.iter_child_nodes(node):
+            visit(child)
 
-            return len(self.errors) == 0
+        if is_function:
+            stack.pop()
 
-        except SyntaxError as e:
-            self.errors.append(f"{filepath}: Syntax error - {e}")
-            return False
+    visit(tree)
+    return flags
 
-    def _visit_node(self, node: ast.AST, filepath: Path, parent_name: str = ""):
-        """Recursively visit AST nodes and validate docstrings.
 
-        Args:
-            node (ast.AST): AST node to visit.
-            filepath (Path): Path to the source file.
-            parent_name (str): Name of parent class/function.
+def _raw_docstring(node: ast.AST) -> str | None:
+    """Return a node's docstring without the cleandoc pass.
 
-        """
-        # Check classes
+    ``ast.get_docstring`` dedents and cleans the string, but the format
+    regexes tolerate leading indentation via ``re.MULTILINE``, so the raw
+    constant is sufficient and cheaper — this runs for every public class
+    and function.
+
+    Args:
+        node (ast.AST): Class or function definition node.
+
+    Returns:
+        str | None: The raw docstring, or None if the node has none.
+
+    """
+    if (
+        node.body
+        and isinstance(node.body[0], ast.Expr)
+        and isinstance(node.body[0].value, ast.Constant)
+        and isinstance(node.body[0].value.value, str)
+    ):
+        return node.body[0].value.value
+    return None
+
+
+def _extract_records(tree: ast.AST) -> tuple[DocstringRecord, ...]:
+    """Extract docstring records for all public classes and functions.
+
+    Args:
+        tree (ast.AST): Parsed module tree.
+
+    Returns:
+        tuple[DocstringRecord, ...]: One record per public class/function,
+            in source order.
+
+    """
+    flags = _collect_return_flags(tree)
+    records: list[DocstringRecord] = []
+
+    def visit(node: ast.AST, parent_name: str = ""):
         if isinstance(node, ast.ClassDef):
-            self._validate_class(node, filepath, parent_name)
+            # Skip private classes
+            if not node.name.startswith("_"):
+                full_name = f"{parent_name}.{node.name}" if parent_name else node.name
+                records.append(
+                    (node.lineno, "class", full_name, _raw_docstring(node), (), False)
+                )
 
-        # Check functions
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            self._validate_function(node, filepath, parent_name)
+        # Skip private functions and special methods (except __init__)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and (
+            not node.name.startswith("_")
+            or node.name in ("__init__", "__post_init__")
+        ):
+            full_name = f"{parent_name}.{node.name}" if parent_name else node.name
+
+            # Function arguments (excluding 'self' and 'cls')
+            args = tuple(
+                arg.arg for arg in node.args.args if arg.arg not in ("self", "cls")
+            )
+
+            records.append(
+                (
+                    node.lineno,
+                    "function",
+                    full_name,
+                    _raw_docstring(node),
+                    args,
+                    flags.get(node, False),
+                )
+            )
 
         # Recursively visit child nodes
         for child in ast.iter_child_nodes(node):
             child_parent = (
                 f"{parent_name}.{node.name}" if hasattr(node, "name") else parent_name
             )
-            self._visit_node(child, filepath, child_parent)
+            visit(child, child_parent)
 
-    def _validate_class(self, node: ast.ClassDef, filepath: Path, parent_name: str):
-        """Validate a class docstring.
+    visit(tree)
+    return tuple(records)
 
-        Args:
-            node (ast.ClassDef): Class node to validate.
-            filepath (Path): Path to the source file.
-            parent_name (str): Name of parent scope.
 
-        """
-        # Skip private classes
-        if node.name.startswith("_"):
-            return
+@functools.lru_cache(maxsize=4096)
+def _extract_file(filepath_str: str, mtime_ns: int, size: int) -> tuple[DocstringRecord, ...]:
+    """Parse a file and extract its docstring records, memoized in-process.
 
-        full_name = f"{parent_name}.{node.name}" if parent_name else node.name
+    The mtime/size arguments are part of the cache key so a file edited
+    between calls is re-parsed.
 
-        # Check for docstring
-        docstring = ast.get_docstring(node)
-        if not docstring:
-            self.errors.append(
-                f"{filepath}:{node.lineno}: Class {full_name} missing docstring"
-            )
-            return
+    Args:
+        filepath_str (str): Path to the Python file.
+        mtime_ns (int): File modification time in nanoseconds.
+        size (int): File size in bytes.
 
-        # Validate docstring format
-        self._validate_docstring_format(
-            docstring, full_name, filepath, node.lineno, is_class=True
-        )
+    Returns:
+        tuple[DocstringRecord, ...]: Extracted docstring records.
 
-    def _validate_function(
-        self,
-        node: ast.FunctionDef | ast.AsyncFunctionDef,
-        filepath: Path,
-        parent_name: str,
-    ):
-        """Validate a function/method docstring.
+    Raises:
+        SyntaxError: If the file cannot be parsed.
 
-        Args:
-            node (ast.FunctionDef | ast.AsyncFunctionDef): Function node to validate.
-            filepath (Path): Path to the source file.
-            parent_name (str): Name of parent class.
+    """
+    # Hand ast.parse raw bytes so decoding happens once inside the parser
+    # instead of in a separate Python-level pass. Large modules are memory-
+    # mapped to avoid holding a second full copy in a read buffer; small
+    # files stay on the plain read path where mmap setup would cost more
+    # than it saves.
+    if size > _MMAP_THRESHOLD:
+        import mmap
+
+        with open(filepath_str, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            content = bytes(mm)
+    else:
+        content = Path(filepath_str).read_bytes()
+
+    # type_comments tracking is tokenizer overhead we never use, and the
+    # feature_version pin (the project's requires-python floor) lets the
+    # parser skip newer-grammar fallback paths
+    tree = ast.parse(
+        content,
+        filename=filepath_str,
+        type_comments=False,
+        feature_version=(3, 10),
+    )
+    return _extract_records(tree)
+
+
+def _load_records(filepath: Path) -> tuple[DocstringRecord, ...]:
+    """Load docstring records for a file, using caches where possible.
+
+    Checks the on-disk cache (when DOCSTRING_VALIDATOR_CACHE=1) keyed by
+    path, mtime, and size; falls through to the memoized parse and stores
+    the result for the next invocation.
+
+    Args:
+        filepath (Path): Path to the Python file.
 
-        """
-        # Skip private functions and special methods (except __init__)
-        if node.name.startswith("_") and node.name not in ("__init__", "__post_init__"):
-            return
+    Returns:
+        tuple[DocstringRecord, ...]: Docstring records for the file.
 
-        full_name = f"{parent_name}.{node.name}" if parent_name else node.name
+    Raises:
+        SyntaxError: If the file cannot be parsed.
 
-        # Check for docstring
-        docstring = ast.get_docstring(node)
-        if not docstring:
-            self.errors.append(
-                f"{filepath}:{node.lineno}: Function {full_name} missing docstring"
-            )
-            return
+    """
+    st = filepath.stat()
 
-        # Get function arguments (excluding 'self' and 'cls')
-        args = [arg.arg for arg in node.args.args if arg.arg not in ("self", "cls")]
+    cache_path = None
+    if _cache_enabled():
+        import hashlib
+        import pickle
 
-        # Check if function has return statement
-        has_return = self._has_return_statement(node)
+        key = hashlib.blake2b(
+            f"{filepath}:{st.st_mtime_ns}:{st.st_size}".encode()
+        ).hexdigest()
+        cache_path = _CACHE_DIR / key
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass  # Corrupt or unreadable cache entry; re-extract
 
-        # Validate docstring format
-        self._validate_docstring_format(
-            docstring,
-            full_name,
-            filepath,
-            node.lineno,
-            args=args,
-            has_return=has_return,
-        )
+    records = _extract_file(str(filepath), st.st_mtime_ns, st.st_size)
+
+    if cache_path is not None:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(records, f)
+
+    return records
+
+
+class DocstringValidator:
+    """Validator for Google-style docstrings.
+
+    This class parses Python files and validates that all public functions,
+    methods, and classes have proper Google-style docstrings with required
+    sections.
+
+    Attributes:
+        errors (List[Issue]): Structured validation errors as
+            (filepath, lineno, name, message) tuples.
+        warnings (List[Issue]): Structured validation warnings as
+            (filepath, lineno, name, message) tuples.
+
+    """
+
+    def __init__(self):
+        """Initialize the docstring validator."""
+        self.errors: list[Issue] = []
+        self.warnings: list[Issue] = []
+
+    def validate_file(self, filepath: Path) -> bool:
+        """Validate all docstrings in a Python file.
+
+        Args:
+            filepath (Path): Path to the Python file to validate.
+
+        Returns:
+            bool: True if all validations pass, False otherwise.
+
+        """
+        try:
+            records = _load_records(filepath)
+        except SyntaxError as e:
+            self.errors.append((str(filepath), e.lineno or 0, "module", f"Syntax error - {e}"))
+            return False
+
+        for lineno, kind, name, docstring, args, has_return in records:
+            # Check for docstring
+            if not docstring:
+                label = "Class" if kind == "class" else "Function"
+                self.errors.append(
+                    (str(filepath), lineno, name, f"{label} missing docstring")
+                )
+                continue
+
+            # Validate docstring format
+            self._validate_docstring_format(
+                docstring,
+                name,
+                filepath,
+                lineno,
+                is_class=kind == "class",
+                args=list(args),
+                has_return=has_return,
+            )
+
+        return len(self.errors) == 0
 
     def _validate_docstring_format(
         self,
@@ -187,74 +360,136 @@ class DocstringValidator:
 
         """
         args = args or []
+        path_str = str(filepath)
 
         # Check for summary line
         lines = docstring.strip().split("\n")
         if not lines or not lines[0].strip():
             self.errors.append(
-                f"{filepath}:{lineno}: {name} - Docstring must start with summary line"
+                (path_str, lineno, name, "Docstring must start with summary line")
             )
 
         # Check for Args section if function has arguments
         if args and not is_class:
-            if not re.search(r"^\s*Args:\s*$", docstring, re.MULTILINE):
-                self.errors.append(
-                    f"{filepath}:{lineno}: {name} - Missing 'Args:' section"
-                )
+            if not _RE_ARGS_HDR.search(docstring):
+                self.errors.append((path_str, lineno, name, "Missing 'Args:' section"))
             else:
-                # Validate that all args are documented
+                # Collect documented arg names in one scan instead of one
+                # regex walk per argument
+                documented = {m.group(1) for m in _RE_ARG_ENTRY.finditer(docstring)}
                 for arg in args:
-                    if not re.search(rf"^\s*{arg}\s*\(.*?\):", docstring, re.MULTILINE):
+                    if arg not in documented:
                         self.warnings.append(
-                            f"{filepath}:{lineno}: {name} - Argument '{arg}' not documented"
+                            (path_str, lineno, name, f"Argument '{arg}' not documented")
                         )
 
         # Check for Returns section if function returns something
-        if (
-            has_return
-            and not is_class
-            and not re.search(r"^\s*Returns:\s*$", docstring, re.MULTILINE)
-        ):
-            self.warnings.append(
-                f"{filepath}:{lineno}: {name} - Missing 'Returns:' section"
-            )
+        if has_return and not is_class and not _RE_RETURNS_HDR.search(docstring):
+            self.warnings.append((path_str, lineno, name, "Missing 'Returns:' section"))
 
         # Check for Attributes section in classes
-        if is_class and not re.search(r"^\s*Attributes:\s*$", docstring, re.MULTILINE):
+        if is_class and not _RE_ATTRIBUTES_HDR.search(docstring):
             # Not an error, just informational
             pass
 
-    def _has_return_statement(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef
-    ) -> bool:
-        """Check if a function has a return statement with a value.
+    def print_results(self, output_format: str = "text"):
+        """Print validation results to stdout.
 
-        Args:
-            node (ast.FunctionDef | ast.AsyncFunctionDef): Function node to check.
+        Issues are formatted once at the end and written with a single
+        stdout write, rather than one f-string and print call per finding.
 
-        Returns:
-            bool: True if function has return statement with value.
+        Args:
+            output_format (str): Either "text" for the human-readable report
+                or "json" for machine-readable output.
 
         """
-        for child in ast.walk(node):
-            if isinstance(child, ast.Return) and child.value is not None:
-                return True
-        return False
+        if output_format == "json":
+            import json
+
+            payload = {
+                "errors": [
+                    {"file": path, "line": line, "name": name, "message": msg}
+                    for path, line, name, msg in self.errors
+                ],
+                "warnings": [
+                    {"file": path, "line": line, "name": name, "message": msg}
+                    for path, line, name, msg in self.warnings
+                ],
+            }
+            sys.stdout.write(json.dumps(payload, indent=2) + "\n")
+            return
 
-    def print_results(self):
-        """Print validation results to stdout."""
+        parts: list[str] = []
         if self.errors:
-            print("\n❌ Docstring Validation Errors:")
-            for error in self.errors:
-                print(f"  {error}")
+            parts.append("\n❌ Docstring Validation Errors:\n")
+            parts.append(
+                "\n".join(
+                    f"  {path}:{line}: {name} - {msg}"
+                    for path, line, name, msg in self.errors
+                )
+            )
+            parts.append("\n")
 
         if self.warnings:
-            print("\n⚠️  Docstring Validation Warnings:")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            parts.append("\n⚠️  Docstring Validation Warnings:\n")
+            parts.append(
+                "\n".join(
+                    f"  {path}:{line}: {name} - {msg}"
+                    for path, line, name, msg in self.warnings
+                )
+            )
+            parts.append("\n")
+
+        if not parts:
+            parts.append("✅ All docstrings validated successfully!\n")
+
+        sys.stdout.write("".join(parts))
+
+
+def _validate_one(filepath: Path) -> tuple[list[Issue], list[Issue]]:
+    """Validate a single file in a worker process.
 
-        if not self.errors and not self.warnings:
-            print("✅ All docstrings validated successfully!")
+    Args:
+        filepath (Path): Path to the Python file to validate.
+
+    Returns:
+        tuple[list[Issue], list[Issue]]: The errors and warnings for the file.
+
+    """
+    validator = DocstringValidator()
+    validator.validate_file(filepath)
+    return validator.errors, validator.warnings
+
+
+# Minimum file count before fanning out to worker processes; below this the
+# fork/spawn overhead outweighs the parallel parse win.
+_PARALLEL_THRESHOLD = 4
+
+# Ignore globs mirroring autoapi_ignore in docs/source/conf.py, so broad
+# invocations (e.g. `find . -name '*.py'`) skip test code before any stat
+# or parse work happens.
+_IGNORE_GLOBS = (
+    "*/tests/*",
+    "*/test_*.py",
+    "*conftest.py",
+)
+
+
+def _should_skip(filepath: Path) -> bool:
+    """Check whether a file should be excluded from validation.
+
+    Args:
+        filepath (Path): Candidate file path.
+
+    Returns:
+        bool: True if the file is test code and should be skipped.
+
+    """
+    if "test_" in filepath.name or "tests" in filepath.parts:
+        return True
+
+    posix_path = filepath.as_posix()
+    return any(fnmatch.fnmatch(posix_path, pattern) for pattern in _IGNORE_GLOBS)
 
 
 def main():
@@ -264,33 +499,50 @@ def main():
         int: Exit code (0 for success, 1 for errors).
 
     """
-    if len(sys.argv) < 2:
-        print("Usage: python validate_docstrings.py file1.py file2.py ...")
+    argv = sys.argv[1:]
+    output_format = "text"
+    if "--format=json" in argv:
+        argv = [a for a in argv if a != "--format=json"]
+        output_format = "json"
+
+    if not argv:
+        print(
+            "Usage: python validate_docstrings.py [--format=json] file1.py file2.py ..."
+        )
         return 1
 
-    validator = DocstringValidator()
-
-    # Validate each file
-    all_valid = True
-    for filepath_str in sys.argv[1:]:
-        filepath = Path(filepath_str)
-
-        # Skip test files
-        if "test_" in filepath.name or filepath.parts and "tests" in filepath.parts:
+    # Filter test files before doing any stat or parse work
+    filepaths = []
+    for filepath in map(Path, argv):
+        if _should_skip(filepath):
             continue
 
         if not filepath.exists():
             print(f"Warning: {filepath} does not exist")
             continue
 
-        if not validator.validate_file(filepath):
-            all_valid = False
+        filepaths.append(filepath)
+
+    # Validate each file; the AST work is independent per file and
+    # CPU-bound, so larger batches fan out across processes
+    validator = DocstringValidator()
+    if len(filepaths) < _PARALLEL_THRESHOLD:
+        for filepath in filepaths:
+            validator.validate_file(filepath)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(_validate_one, filepaths, chunksize=8))
+        for errors, warnings in results:
+            validator.errors.extend(errors)
+            validator.warnings.extend(warnings)
 
     # Print results
-    validator.print_results()
+    validator.print_results(output_format)
 
     # Return exit code
-    return 0 if all_valid else 1
+    return 0 if len(validator.errors) == 0 else 1
 
 
 if __name__ == "__main__":